@@ -5,65 +5,79 @@ Loads configuration from environment variables and .env file.
 All configuration values should be accessed through this module.
 """
 
+import json
+import logging
 import os
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
-# First try current directory, then parent directory
-load_dotenv()
-
-env_path = Path(__file__).parent.parent / ".env"
-if env_path.exists():
-    load_dotenv(env_path)
-
-
+# Prefer the project-root .env; otherwise fall back to dotenv's own search
+env_path = Path(__file__).resolve().parent.parent / ".env"
+ENV_FILE_FOUND = env_path.is_file()
+load_dotenv(dotenv_path=env_path if ENV_FILE_FOUND else None, override=False)
+
+
+def _parse_log_level(value: str) -> str:
+    """Normalize a LOG_LEVEL name, falling back to INFO if it is unknown."""
+    level = value.strip().upper()
+    if isinstance(logging.getLevelName(level), int):
+        return level
+    logging.getLogger("askills").warning(f"[Config] Unknown LOG_LEVEL {value!r}, using INFO")
+    return "INFO"
+
+
+# Fields that can be overridden from the environment; unset ones keep their defaults
+_ENV_FIELDS = (
+    "ANTHROPIC_API_KEY",
+    "ANTHROPIC_BASE_URL",
+    "LLM_GATEWAY_URL",
+    "LLM_GATEWAY_HEADERS",
+    "CLAUDE_MODEL",
+    "CLAUDE_AGENT_CWD",
+    "CLAUDE_AGENT_SKILLS_DIR",
+    "HOST",
+    "PORT",
+    "LOG_LEVEL",
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Application configuration loaded from environment variables."""
 
     # API credentials
-    ANTHROPIC_API_KEY: str = os.environ.get("ANTHROPIC_API_KEY", "")
+    ANTHROPIC_API_KEY: str = field(default="", repr=False)
 
     # Corporate LLM Gateway settings
     # ANTHROPIC_BASE_URL is the standard env var used by Anthropic SDK
-    ANTHROPIC_BASE_URL: str = os.environ.get("ANTHROPIC_BASE_URL", "")
+    ANTHROPIC_BASE_URL: str = ""
 
     # Alternative name for gateway URL (for backwards compatibility)
-    LLM_GATEWAY_URL: str = os.environ.get("LLM_GATEWAY_URL", "")
+    LLM_GATEWAY_URL: str = ""
 
     # Custom headers for gateway authentication (JSON string)
     # Example: '{"X-Api-Key": "your-key", "X-Tenant-Id": "your-tenant"}'
-    LLM_GATEWAY_HEADERS: str = os.environ.get("LLM_GATEWAY_HEADERS", "")
+    LLM_GATEWAY_HEADERS: str = field(default="", repr=False)
 
     # Model override (some gateways use different model names)
-    CLAUDE_MODEL: str = os.environ.get("CLAUDE_MODEL", "")
-
-    @classmethod
-    def get_base_url(cls) -> str:
-        """Get the API base URL (gateway or default Anthropic)."""
-        return cls.ANTHROPIC_BASE_URL or cls.LLM_GATEWAY_URL or ""
-
-    @classmethod
-    def get_gateway_headers(cls) -> dict:
-        """Parse gateway headers from JSON string."""
-        if cls.LLM_GATEWAY_HEADERS:
-            import json
-            try:
-                return json.loads(cls.LLM_GATEWAY_HEADERS)
-            except json.JSONDecodeError:
-                return {}
-        return {}
+    CLAUDE_MODEL: str = ""
 
     # Agent settings
-    CLAUDE_AGENT_CWD: str = os.environ.get("CLAUDE_AGENT_CWD", "/app")
-    CLAUDE_AGENT_SKILLS_DIR: str = os.environ.get("CLAUDE_AGENT_SKILLS_DIR", "/app/skills")
+    CLAUDE_AGENT_CWD: str = "/app"
+    CLAUDE_AGENT_SKILLS_DIR: str = "/app/skills"
 
     # Server settings
-    HOST: str = os.environ.get("HOST", "0.0.0.0")
-    PORT: int = int(os.environ.get("PORT", "8080"))
+    HOST: str = "0.0.0.0"
+    PORT: int = 8080
+    LOG_LEVEL: str = "INFO"
 
     # Agent tools configuration
-    ALLOWED_TOOLS: list[str] = [
+    ALLOWED_TOOLS: tuple[str, ...] = (
         "Skill",
         "Read",
         "Write",
@@ -71,34 +85,66 @@ class Config:
         "Edit",
         "Glob",
         "Grep",
-    ]
+    )
 
     # Permission mode for the agent
     PERMISSION_MODE: str = "acceptEdits"
 
     # Setting sources for the agent
-    SETTING_SOURCES: list[str] = ["user", "project"]
+    SETTING_SOURCES: tuple[str, ...] = ("user", "project")
+
+    # Gateway headers parsed from LLM_GATEWAY_HEADERS (computed once)
+    GATEWAY_HEADERS: Mapping[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        headers = {}
+        if self.LLM_GATEWAY_HEADERS:
+            try:
+                headers = json.loads(self.LLM_GATEWAY_HEADERS)
+            except json.JSONDecodeError:
+                headers = {}
+        object.__setattr__(self, "GATEWAY_HEADERS", MappingProxyType(headers))
 
     @classmethod
-    def has_api_credentials(cls) -> bool:
+    def from_env(cls) -> "Config":
+        """Build a Config from the environment; unset variables keep the field defaults."""
+        values = {name: os.environ[name] for name in _ENV_FIELDS if name in os.environ}
+        if "PORT" in values:
+            values["PORT"] = int(values["PORT"])
+        if "LOG_LEVEL" in values:
+            values["LOG_LEVEL"] = _parse_log_level(values["LOG_LEVEL"])
+        return cls(**values)
+
+    def get_base_url(self) -> str:
+        """Get the API base URL (gateway or default Anthropic)."""
+        return self.ANTHROPIC_BASE_URL or self.LLM_GATEWAY_URL or ""
+
+    def get_gateway_headers(self) -> Mapping[str, str]:
+        """Get the read-only gateway headers parsed from LLM_GATEWAY_HEADERS."""
+        return self.GATEWAY_HEADERS
+
+    def has_api_credentials(self) -> bool:
         """Check if API credentials are configured."""
-        return bool(cls.ANTHROPIC_API_KEY or cls.get_base_url())
+        return bool(self.ANTHROPIC_API_KEY or self.get_base_url())
 
-    @classmethod
-    def get_claude_dir(cls) -> Path:
+    def get_claude_dir(self) -> Path:
         """Get the .claude directory path."""
-        return Path(cls.CLAUDE_AGENT_CWD) / ".claude"
+        return Path(self.CLAUDE_AGENT_CWD) / ".claude"
 
-    @classmethod
-    def get_skills_source_path(cls) -> Path:
+    def get_skills_source_path(self) -> Path:
         """Get the skills source directory path."""
-        return Path(cls.CLAUDE_AGENT_SKILLS_DIR)
+        return Path(self.CLAUDE_AGENT_SKILLS_DIR)
 
-    @classmethod
-    def get_claude_skills_dir(cls) -> Path:
+    def get_claude_skills_dir(self) -> Path:
         """Get the .claude/skills directory path."""
-        return cls.get_claude_dir() / "skills"
+        return self.get_claude_dir() / "skills"
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """Get the process-wide Config, built from the environment on first call."""
+    return Config.from_env()
 
 
 # Singleton instance for easy import
-config = Config()
+config = get_config()
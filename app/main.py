@@ -14,7 +14,7 @@ Endpoints:
 
 Skills Wiring:
 - At container build time, skills are copied to /app/skills
-- At runtime, this script creates symlinks from /app/.claude/skills/* to /app/skills/*
+- At runtime, skills_setup.py creates symlinks from /app/.claude/skills/* to /app/skills/*
 - The Claude Agent SDK loads SKILL.md files from .claude/skills/
 
 Configuration:
@@ -23,80 +23,41 @@ Configuration:
 """
 
 import json
+import logging
 from datetime import datetime
 from typing import Optional, List
 
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
 from config import config
+from skills_setup import setup_skills_directory
 
+logger = logging.getLogger("askills")
 
-def setup_skills_directory():
-    """
-    Set up the .claude/skills directory structure.
-
-    The Claude Agent SDK expects skills to be in .claude/skills/ relative to
-    the working directory. This function creates symlinks from the SDK's
-    expected location to our skills source directory.
-
-    Directory structure after setup:
-        /app/
-        ├── .claude/
-        │   └── skills/
-        │       ├── skill-one -> /app/skills/skill-one
-        │       └── skill-two -> /app/skills/skill-two
-        └── skills/
-            ├── skill-one/
-            │   └── SKILL.md
-            └── skill-two/
-                └── SKILL.md
-    """
-    claude_dir = config.get_claude_dir()
-    claude_skills_dir = config.get_claude_skills_dir()
-    skills_source_path = config.get_skills_source_path()
-
-    # Ensure .claude directory exists
-    claude_dir.mkdir(parents=True, exist_ok=True)
-    claude_skills_dir.mkdir(parents=True, exist_ok=True)
-
-    print(f"[Setup] Claude directory: {claude_dir}")
-    print(f"[Setup] Skills source: {skills_source_path}")
+# The SDK is optional at import time so the service can still report
+# health without it; startup logs the failure and requests return 503.
+try:
+    from claude_agent_sdk import (
+        ClaudeAgentOptions,
+        query,
+        AssistantMessage,
+        TextBlock,
+        ToolUseBlock,
+        ToolResultBlock,
+        ThinkingBlock,
+    )
+    HAS_CLAUDE_AGENT_SDK = True
+    SDK_IMPORT_ERROR = None
+except ImportError as e:
+    HAS_CLAUDE_AGENT_SDK = False
+    SDK_IMPORT_ERROR = e
 
-    # Check if skills source directory exists and has content
-    if not skills_source_path.exists():
-        print(f"[Setup] Skills source directory does not exist: {skills_source_path}")
-        print("[Setup] No skills will be loaded. Add skills to the skills/ directory.")
-        return
 
-    # Create symlinks for each skill folder
-    skill_count = 0
-    for skill_folder in skills_source_path.iterdir():
-        if skill_folder.is_dir():
-            # Check if this looks like a skill (has SKILL.md)
-            skill_md = skill_folder / "SKILL.md"
-            if skill_md.exists():
-                link_path = claude_skills_dir / skill_folder.name
-
-                # Remove existing link/directory if present
-                if link_path.is_symlink() or link_path.exists():
-                    if link_path.is_symlink():
-                        link_path.unlink()
-                    else:
-                        import shutil
-                        shutil.rmtree(link_path)
-
-                # Create symlink
-                link_path.symlink_to(skill_folder.resolve())
-                print(f"[Setup] Linked skill: {skill_folder.name}")
-                skill_count += 1
-            else:
-                print(f"[Setup] Skipping {skill_folder.name} (no SKILL.md found)")
-
-    if skill_count == 0:
-        print("[Setup] No skills found. Add skill folders with SKILL.md to skills/")
-    else:
-        print(f"[Setup] Loaded {skill_count} skill(s)")
+def truncate(text: str, limit: int = 500) -> str:
+    """Cut text to at most limit characters, marking the cut with '...'."""
+    return text[:limit] + "..." if len(text) > limit else text
 
 
 # Pydantic models for API
@@ -139,16 +100,18 @@ app = FastAPI(
 # Global agent options (initialized on startup)
 agent_options = None
 skills_count = 0
+has_credentials = False
 
 
 def init_agent_options():
     """Initialize Claude Agent options."""
-    from claude_agent_sdk import ClaudeAgentOptions
+    if not HAS_CLAUDE_AGENT_SDK:
+        raise ImportError(str(SDK_IMPORT_ERROR))
 
     options_kwargs = {
         "cwd": config.CLAUDE_AGENT_CWD,
-        "setting_sources": config.SETTING_SOURCES,
-        "allowed_tools": config.ALLOWED_TOOLS,
+        "setting_sources": list(config.SETTING_SOURCES),
+        "allowed_tools": list(config.ALLOWED_TOOLS),
         "permission_mode": config.PERMISSION_MODE,
     }
 
@@ -162,42 +125,48 @@ def init_agent_options():
 @app.on_event("startup")
 async def startup_event():
     """Initialize the agent on startup."""
-    global agent_options, skills_count
+    global agent_options, skills_count, has_credentials
 
-    print("=" * 60)
-    print("Claude Agent SDK HTTP Service Starting...")
-    print("=" * 60)
+    # Configure only the service's logger; the root logger and library loggers are left alone
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(config.LOG_LEVEL)
+
+    logger.info("=" * 60)
+    logger.info("Claude Agent SDK HTTP Service Starting...")
+    logger.info("=" * 60)
+
+    has_credentials = config.has_api_credentials()
 
     # Log gateway configuration
     base_url = config.get_base_url()
     if base_url:
-        print(f"[Config] Using LLM Gateway: {base_url}")
+        logger.info(f"[Config] Using LLM Gateway: {base_url}")
     if config.CLAUDE_MODEL:
-        print(f"[Config] Model override: {config.CLAUDE_MODEL}")
-    if config.get_gateway_headers():
-        print(f"[Config] Custom headers configured: {list(config.get_gateway_headers().keys())}")
+        logger.info(f"[Config] Model override: {config.CLAUDE_MODEL}")
+    gateway_headers = config.get_gateway_headers()
+    if gateway_headers:
+        logger.info(f"[Config] Custom headers configured: {list(gateway_headers.keys())}")
 
     # Step 1: Set up skills directory
-    print("\n[Step 1] Setting up skills directory...")
-    setup_skills_directory()
-
-    # Count skills
-    claude_skills_dir = config.get_claude_skills_dir()
-    if claude_skills_dir.exists():
-        skills_count = len([d for d in claude_skills_dir.iterdir() if d.is_dir() or d.is_symlink()])
+    logger.info("[Step 1] Setting up skills directory...")
+    skills_count = setup_skills_directory(config.CLAUDE_AGENT_CWD, config.CLAUDE_AGENT_SKILLS_DIR)
 
     # Step 2: Initialize agent options
-    print("\n[Step 2] Initializing agent options...")
+    logger.info("[Step 2] Initializing agent options...")
     try:
         agent_options = init_agent_options()
-        print("[Setup] Agent options initialized successfully")
+        logger.info("[Setup] Agent options initialized successfully")
     except ImportError as e:
-        print(f"[Error] Failed to import claude_agent_sdk: {e}")
-        print("[Error] Make sure claude-agent-sdk is installed")
+        logger.error(f"[Error] Failed to import claude_agent_sdk: {e}")
+        logger.error("[Error] Make sure claude-agent-sdk is installed")
 
-    print("\n" + "=" * 60)
-    print(f"Service ready! Skills loaded: {skills_count}")
-    print("=" * 60 + "\n")
+    logger.info("=" * 60)
+    logger.info(f"Service ready! Skills loaded: {skills_count}")
+    logger.info("=" * 60)
 
 
 @app.get("/health", response_model=HealthResponse)
@@ -209,29 +178,38 @@ async def health():
     )
 
 
-@app.post("/chat", response_model=ChatResponse)
-async def chat(req: ChatRequest) -> ChatResponse:
+@app.post(
+    "/chat",
+    response_model=ChatResponse,
+    responses={
+        200: {
+            "description": "Reply streamed as plain text, or a ChatResponse with ?stream=false",
+            "content": {"text/plain": {"schema": {"type": "string"}}},
+        },
+    },
+)
+async def chat(req: ChatRequest, stream: bool = True):
     """
     Send a message to the Claude agent and get a response.
 
     The agent has access to all configured skills and can use them
     to help answer your questions or perform tasks.
-    """
-    from claude_agent_sdk import (
-        query,
-        AssistantMessage,
-        TextBlock,
-    )
 
+    By default the reply is streamed back as plain text while the agent
+    generates it. Pass ?stream=false to get a single ChatResponse instead.
+    """
     if not agent_options:
         raise HTTPException(status_code=503, detail="Agent not initialized")
 
-    if not config.has_api_credentials():
+    if not has_credentials:
         raise HTTPException(
             status_code=500,
             detail="ANTHROPIC_API_KEY or LLM_GATEWAY_URL environment variable not set"
         )
 
+    if stream:
+        return StreamingResponse(stream_reply(req.message), media_type="text/plain")
+
     # Collect response chunks
     reply_chunks: list[str] = []
 
@@ -249,6 +227,26 @@ async def chat(req: ChatRequest) -> ChatResponse:
     return ChatResponse(reply=full_reply)
 
 
+async def stream_reply(message: str):
+    """Yield the agent's reply text as it arrives."""
+    sent_any = False
+
+    try:
+        async for msg in query(prompt=message, options=agent_options):
+            if isinstance(msg, AssistantMessage):
+                for block in msg.content:
+                    if isinstance(block, TextBlock) and block.text:
+                        sent_any = True
+                        yield block.text
+    except Exception as e:
+        # Headers are already sent, so report the failure in the body
+        yield f"\n\nAgent error: {str(e)}"
+        return
+
+    if not sent_any:
+        yield "No response from agent"
+
+
 @app.post("/chat/verbose", response_model=VerboseChatResponse)
 async def chat_verbose(req: ChatRequest) -> VerboseChatResponse:
     """
@@ -260,19 +258,10 @@ async def chat_verbose(req: ChatRequest) -> VerboseChatResponse:
     - total_steps: Total number of execution steps
     - tools_used: List of tools/skills that were invoked
     """
-    from claude_agent_sdk import (
-        query,
-        AssistantMessage,
-        TextBlock,
-        ToolUseBlock,
-        ToolResultBlock,
-        ThinkingBlock,
-    )
-
     if not agent_options:
         raise HTTPException(status_code=503, detail="Agent not initialized")
 
-    if not config.has_api_credentials():
+    if not has_credentials:
         raise HTTPException(
             status_code=500,
             detail="ANTHROPIC_API_KEY or LLM_GATEWAY_URL environment variable not set"
@@ -282,12 +271,14 @@ async def chat_verbose(req: ChatRequest) -> VerboseChatResponse:
     reply_chunks: list[str] = []
     steps: list[ExecutionStep] = []
     tools_used: list[str] = []
+    tools_seen: set[str] = set()
     step_num = 0
 
     def add_step(step_type: str, content: str, tool_name: str = None, tool_input: dict = None):
         nonlocal step_num
         step_num += 1
-        steps.append(ExecutionStep(
+        # Values come from this handler, so skip pydantic validation
+        steps.append(ExecutionStep.model_construct(
             step=step_num,
             timestamp=datetime.now().isoformat(),
             type=step_type,
@@ -295,66 +286,79 @@ async def chat_verbose(req: ChatRequest) -> VerboseChatResponse:
             tool_name=tool_name,
             tool_input=tool_input,
         ))
-        # Also print to console for real-time visibility
-        print(f"[Step {step_num}] [{step_type.upper()}] {content[:200]}{'...' if len(content) > 200 else ''}")
+        # Also log to console for real-time visibility
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"[Step {step_num}] [{step_type.upper()}] {truncate(content, 200)}")
+
+    # Consecutive text blocks are merged into a single "text" step
+    pending_text: list[str] = []
+
+    def flush_text():
+        if pending_text:
+            add_step(step_type="text", content=truncate("".join(pending_text)))
+            pending_text.clear()
 
     try:
-        print("\n" + "=" * 60)
-        print(f"[Query] {req.message}")
-        print("=" * 60)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=" * 60)
+            logger.info(f"[Query] {req.message}")
+            logger.info("=" * 60)
 
         async for msg in query(prompt=req.message, options=agent_options):
             if isinstance(msg, AssistantMessage):
                 for block in msg.content:
                     if isinstance(block, TextBlock):
                         reply_chunks.append(block.text)
-                        add_step(
-                            step_type="text",
-                            content=block.text[:500] + ("..." if len(block.text) > 500 else "")
-                        )
+                        pending_text.append(block.text)
+                        continue
 
-                    elif isinstance(block, ToolUseBlock):
+                    flush_text()
+
+                    if isinstance(block, ToolUseBlock):
                         tool_name = block.name
                         tool_input = block.input if hasattr(block, 'input') else {}
 
                         # Track tools used
-                        if tool_name not in tools_used:
+                        if tool_name not in tools_seen:
+                            tools_seen.add(tool_name)
                             tools_used.append(tool_name)
 
-                        # Format input for display
-                        input_str = json.dumps(tool_input, indent=2) if tool_input else "{}"
-                        if len(input_str) > 300:
-                            input_str = input_str[:300] + "..."
+                        # Drop large or unserializable inputs to keep the response renderable
+                        try:
+                            input_size = len(json.dumps(tool_input, separators=(",", ":"))) if tool_input else len("{}")
+                        except (TypeError, ValueError):
+                            input_size = None
 
                         add_step(
                             step_type="tool_use",
                             content=f"Invoking tool: {tool_name}",
                             tool_name=tool_name,
-                            tool_input=tool_input if len(json.dumps(tool_input)) < 1000 else {"truncated": True}
+                            tool_input=tool_input if input_size is not None and input_size < 1000 else {"truncated": True}
                         )
 
                     elif isinstance(block, ToolResultBlock):
                         result_content = str(block.content) if hasattr(block, 'content') else "Result received"
-                        if len(result_content) > 500:
-                            result_content = result_content[:500] + "..."
-
                         add_step(
                             step_type="tool_result",
-                            content=result_content
+                            content=truncate(result_content)
                         )
 
                     elif isinstance(block, ThinkingBlock):
                         thinking = block.thinking if hasattr(block, 'thinking') else str(block)
                         add_step(
                             step_type="thinking",
-                            content=thinking[:500] + ("..." if len(thinking) > 500 else "")
+                            content=truncate(thinking)
                         )
 
-        print("=" * 60)
-        print(f"[Done] Total steps: {step_num}, Tools used: {tools_used}")
-        print("=" * 60 + "\n")
+        flush_text()
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("=" * 60)
+            logger.info(f"[Done] Total steps: {step_num}, Tools used: {tools_used}")
+            logger.info("=" * 60)
 
     except Exception as e:
+        flush_text()
         add_step(step_type="error", content=str(e))
         raise HTTPException(status_code=500, detail=f"Agent error: {str(e)}")
 
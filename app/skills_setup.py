@@ -0,0 +1,109 @@
+"""
+Skills directory setup for the Claude Agent SDK.
+
+Links each skill folder under the skills source directory into
+.claude/skills/, where the SDK discovers SKILL.md files.
+"""
+
+import logging
+import os
+import shutil
+import stat
+from pathlib import Path
+
+logger = logging.getLogger("askills")
+
+
+def setup_skills_directory(cwd: str, skills_source: str) -> int:
+    """
+    Set up the .claude/skills directory structure.
+
+    The Claude Agent SDK expects skills to be in .claude/skills/ relative to
+    the working directory. This function creates symlinks from the SDK's
+    expected location to our skills source directory.
+
+    Directory structure after setup:
+        /app/
+        ├── .claude/
+        │   └── skills/
+        │       ├── skill-one -> /app/skills/skill-one
+        │       └── skill-two -> /app/skills/skill-two
+        └── skills/
+            ├── skill-one/
+            │   └── SKILL.md
+            └── skill-two/
+                └── SKILL.md
+
+    Args:
+        cwd: Agent working directory that holds .claude/
+        skills_source: Directory containing the skill folders
+
+    Returns:
+        Number of skills linked
+    """
+    claude_dir = Path(cwd) / ".claude"
+    claude_skills_dir = claude_dir / "skills"
+    skills_source_path = Path(skills_source)
+
+    # Ensure .claude directory exists
+    claude_dir.mkdir(parents=True, exist_ok=True)
+    claude_skills_dir.mkdir(parents=True, exist_ok=True)
+
+    logger.info(f"[Setup] Claude directory: {claude_dir}")
+    logger.info(f"[Setup] Skills source: {skills_source_path}")
+
+    # Check if skills source directory exists and has content
+    if not skills_source_path.exists():
+        logger.info(f"[Setup] Skills source directory does not exist: {skills_source_path}")
+        logger.info("[Setup] No skills will be loaded. Add skills to the skills/ directory.")
+        return 0
+
+    # Resolve once so every scandir entry path is already absolute
+    skills_source_abs = skills_source_path.resolve()
+
+    # Create symlinks for each skill folder
+    skill_count = 0
+    with os.scandir(skills_source_abs) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+
+            # Check if this looks like a skill (has SKILL.md)
+            if not os.path.isfile(os.path.join(entry.path, "SKILL.md")):
+                logger.info(f"[Setup] Skipping {entry.name} (no SKILL.md found)")
+                continue
+
+            link_path = os.path.join(claude_skills_dir, entry.name)
+            target = entry.path
+
+            # Leave the link alone if it already points at this skill
+            try:
+                if os.readlink(link_path) == target:
+                    logger.info(f"[Setup] Skill already linked: {entry.name}")
+                    skill_count += 1
+                    continue
+            except OSError:
+                pass
+
+            # Remove existing link/directory if present
+            try:
+                link_mode = os.lstat(link_path).st_mode
+            except FileNotFoundError:
+                pass
+            else:
+                if stat.S_ISLNK(link_mode) or not stat.S_ISDIR(link_mode):
+                    os.unlink(link_path)
+                else:
+                    shutil.rmtree(link_path)
+
+            # Create symlink
+            os.symlink(target, link_path)
+            logger.info(f"[Setup] Linked skill: {entry.name}")
+            skill_count += 1
+
+    if skill_count == 0:
+        logger.info("[Setup] No skills found. Add skill folders with SKILL.md to skills/")
+    else:
+        logger.info(f"[Setup] Loaded {skill_count} skill(s)")
+
+    return skill_count
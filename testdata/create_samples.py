@@ -5,6 +5,8 @@ Run this script to create test data files.
 """
 
 import os
+from functools import wraps
+from io import BytesIO
 from pathlib import Path
 
 # Try to import required libraries
@@ -12,42 +14,160 @@ try:
     from reportlab.lib.pagesizes import letter
     from reportlab.lib import colors
     from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+    from reportlab.pdfgen import canvas
+    from reportlab.platypus import Frame, Paragraph, Spacer, Table, TableStyle
     from reportlab.lib.units import inch
     HAS_REPORTLAB = True
 except ImportError:
     HAS_REPORTLAB = False
     print("reportlab not installed. Run: pip install reportlab")
 
+# reportlab uses its C accelerator automatically when it can be imported;
+# since reportlab 4 it ships as the separate rl_accel package
+HAS_RL_ACCEL = False
+if HAS_REPORTLAB:
+    try:
+        import _rl_accel  # noqa: F401
+        HAS_RL_ACCEL = True
+    except ImportError:
+        print("reportlab C accelerator not installed, PDFs will build slower. Run: pip install rl_accel")
+
+# Shared PDF styles, built once at import
+if HAS_REPORTLAB:
+    _STYLES = getSampleStyleSheet()
+
+    _EARNINGS_TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=_STYLES['Heading1'],
+        fontSize=24,
+        spaceAfter=30,
+        alignment=1  # Center
+    )
+    _PRICING_TITLE_STYLE = ParagraphStyle(
+        'CustomTitle',
+        parent=_STYLES['Heading1'],
+        fontSize=22,
+        spaceAfter=20,
+        alignment=1
+    )
+
+    _EARNINGS_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, 0), 11),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
+        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+
+    _SEGMENT_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2d3748')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ])
+
+    _TIER_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3182ce')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTSIZE', (0, 0), (-1, -1), 9),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+        ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#ebf8ff')),
+    ])
+
+    _ADDON_TABLE_STYLE = TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#48bb78')),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('ALIGN', (1, 1), (1, -1), 'LEFT'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
+    ])
+
 try:
     from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.styles import Font, Alignment, Border, Side, PatternFill
-    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.dimensions import ColumnDimension
     HAS_OPENPYXL = True
 except ImportError:
     HAS_OPENPYXL = False
     print("openpyxl not installed. Run: pip install openpyxl")
 
-
+# Shared spreadsheet styles, built once and reused by every cell
+if HAS_OPENPYXL:
+    _BORDER = Border(
+        left=Side(style='thin'),
+        right=Side(style='thin'),
+        top=Side(style='thin'),
+        bottom=Side(style='thin')
+    )
+    _HEADER_FONT = Font(bold=True, color="FFFFFF")
+    _BLUE_FILL = PatternFill(start_color="3182CE", end_color="3182CE", fill_type="solid")
+    _NAVY_FILL = PatternFill(start_color="1A365D", end_color="1A365D", fill_type="solid")
+    _CENTER = Alignment(horizontal='center')
+    _RIGHT = Alignment(horizontal='right')
+    _BOLD = Font(bold=True)
+    _TITLE_FONT = Font(bold=True, size=14)
+
+
+def _requires(available, kind, library):
+    """Replace a builder with a stub that reports the missing library."""
+    def decorator(fn):
+        if available:
+            return fn
+
+        @wraps(fn)
+        def skip(*args, **kwargs):
+            print(f"Skipping {kind} creation - {library} not installed")
+        return skip
+    return decorator
+
+
+def _write_file(output_path, buf):
+    """Write a fully rendered in-memory file to disk in a single write."""
+    with open(output_path, 'wb') as f:
+        f.write(buf.getbuffer())
+
+
+def _draw_single_page(output_path, story):
+    """
+    Draw a one-page story straight onto a canvas.
+
+    The sample PDFs are fixed single-page layouts, so this fills a single
+    frame with SimpleDocTemplate's default margins instead of running its
+    page-template and build machinery.
+    """
+    width, height = letter
+    buf = BytesIO()
+    c = canvas.Canvas(buf, pagesize=letter)
+    frame = Frame(inch, inch, width - 2 * inch, height - 2 * inch)
+    frame.addFromList(story, c)
+    if story:
+        raise ValueError(f"Content does not fit on one page: {output_path}")
+
+    c.showPage()
+    c.save()
+    _write_file(output_path, buf)
+
+
+@_requires(HAS_REPORTLAB, "PDF", "reportlab")
 def create_earnings_pdf(output_path: str):
     """Create a sample Q3 2024 Earnings Report PDF."""
-    if not HAS_REPORTLAB:
-        print("Skipping PDF creation - reportlab not installed")
-        return
-
-    doc = SimpleDocTemplate(output_path, pagesize=letter)
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     story = []
 
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=24,
-        spaceAfter=30,
-        alignment=1  # Center
-    )
-    story.append(Paragraph("TechCorp Inc.", title_style))
+    story.append(Paragraph("TechCorp Inc.", _EARNINGS_TITLE_STYLE))
     story.append(Paragraph("Q3 2024 Earnings Report", styles['Heading2']))
     story.append(Spacer(1, 20))
 
@@ -64,52 +184,33 @@ def create_earnings_pdf(output_path: str):
     # Financial Highlights Table
     story.append(Paragraph("Financial Highlights (in millions USD)", styles['Heading3']))
 
-    data = [
-        ['Metric', 'Q3 2024', 'Q3 2023', 'Change'],
-        ['Revenue', '$2,400', '$2,087', '+15%'],
-        ['Gross Profit', '$1,680', '$1,418', '+18%'],
-        ['Operating Income', '$480', '$376', '+28%'],
-        ['Net Income', '$340', '$279', '+22%'],
-        ['EPS (Diluted)', '$1.85', '$1.52', '+22%'],
-    ]
+    data = (
+        ('Metric', 'Q3 2024', 'Q3 2023', 'Change'),
+        ('Revenue', '$2,400', '$2,087', '+15%'),
+        ('Gross Profit', '$1,680', '$1,418', '+18%'),
+        ('Operating Income', '$480', '$376', '+28%'),
+        ('Net Income', '$340', '$279', '+22%'),
+        ('EPS (Diluted)', '$1.85', '$1.52', '+22%'),
+    )
 
     table = Table(data, colWidths=[2*inch, 1.5*inch, 1.5*inch, 1*inch])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a365d')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 11),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-        ('TEXTCOLOR', (0, 1), (-1, -1), colors.black),
-        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-        ('FONTSIZE', (0, 1), (-1, -1), 10),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-    ]))
+    table.setStyle(_EARNINGS_TABLE_STYLE)
     story.append(table)
     story.append(Spacer(1, 20))
 
     # Segment Performance
     story.append(Paragraph("Segment Performance", styles['Heading3']))
 
-    segments = [
-        ['Segment', 'Revenue', '% of Total', 'YoY Growth'],
-        ['Cloud Services', '$1,200M', '50%', '+25%'],
-        ['Enterprise Software', '$720M', '30%', '+10%'],
-        ['Hardware', '$360M', '15%', '+5%'],
-        ['Professional Services', '$120M', '5%', '+8%'],
-    ]
+    segments = (
+        ('Segment', 'Revenue', '% of Total', 'YoY Growth'),
+        ('Cloud Services', '$1,200M', '50%', '+25%'),
+        ('Enterprise Software', '$720M', '30%', '+10%'),
+        ('Hardware', '$360M', '15%', '+5%'),
+        ('Professional Services', '$120M', '5%', '+8%'),
+    )
 
     seg_table = Table(segments, colWidths=[2*inch, 1.3*inch, 1.2*inch, 1.2*inch])
-    seg_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2d3748')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-    ]))
+    seg_table.setStyle(_SEGMENT_TABLE_STYLE)
     story.append(seg_table)
     story.append(Spacer(1, 20))
 
@@ -122,29 +223,18 @@ def create_earnings_pdf(output_path: str):
         styles['Normal']
     ))
 
-    doc.build(story)
+    _draw_single_page(output_path, story)
     print(f"Created: {output_path}")
 
 
+@_requires(HAS_REPORTLAB, "PDF", "reportlab")
 def create_pricing_pdf(output_path: str):
     """Create a sample Product Pricing PDF."""
-    if not HAS_REPORTLAB:
-        print("Skipping PDF creation - reportlab not installed")
-        return
-
-    doc = SimpleDocTemplate(output_path, pagesize=letter)
-    styles = getSampleStyleSheet()
+    styles = _STYLES
     story = []
 
     # Title
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=22,
-        spaceAfter=20,
-        alignment=1
-    )
-    story.append(Paragraph("CloudPlatform Pro", title_style))
+    story.append(Paragraph("CloudPlatform Pro", _PRICING_TITLE_STYLE))
     story.append(Paragraph("Enterprise Pricing Guide 2024", styles['Heading2']))
     story.append(Spacer(1, 15))
 
@@ -159,48 +249,33 @@ def create_pricing_pdf(output_path: str):
     # Pricing Tiers
     story.append(Paragraph("Subscription Tiers", styles['Heading3']))
 
-    tiers = [
-        ['Plan', 'Monthly', 'Annual', 'Users', 'Storage', 'Support'],
-        ['Starter', '$29', '$290', 'Up to 5', '100 GB', 'Email'],
-        ['Professional', '$99', '$990', 'Up to 25', '1 TB', 'Priority'],
-        ['Business', '$299', '$2,990', 'Up to 100', '10 TB', '24/7 Phone'],
-        ['Enterprise', 'Custom', 'Custom', 'Unlimited', 'Unlimited', 'Dedicated'],
-    ]
+    tiers = (
+        ('Plan', 'Monthly', 'Annual', 'Users', 'Storage', 'Support'),
+        ('Starter', '$29', '$290', 'Up to 5', '100 GB', 'Email'),
+        ('Professional', '$99', '$990', 'Up to 25', '1 TB', 'Priority'),
+        ('Business', '$299', '$2,990', 'Up to 100', '10 TB', '24/7 Phone'),
+        ('Enterprise', 'Custom', 'Custom', 'Unlimited', 'Unlimited', 'Dedicated'),
+    )
 
     tier_table = Table(tiers, colWidths=[1.2*inch, 0.9*inch, 0.9*inch, 1*inch, 1*inch, 1*inch])
-    tier_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3182ce')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 9),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-        ('BACKGROUND', (0, -1), (-1, -1), colors.HexColor('#ebf8ff')),
-    ]))
+    tier_table.setStyle(_TIER_TABLE_STYLE)
     story.append(tier_table)
     story.append(Spacer(1, 20))
 
     # Add-ons
     story.append(Paragraph("Optional Add-ons", styles['Heading3']))
 
-    addons = [
-        ['Add-on', 'Description', 'Price/Month'],
-        ['Extra Storage', 'Additional 1 TB block', '$20'],
-        ['API Access', 'REST API with 10K calls/day', '$50'],
-        ['SSO Integration', 'SAML/OIDC support', '$25'],
-        ['Advanced Analytics', 'BI dashboards & reports', '$75'],
-        ['Data Export', 'Automated backups to S3/GCS', '$30'],
-    ]
+    addons = (
+        ('Add-on', 'Description', 'Price/Month'),
+        ('Extra Storage', 'Additional 1 TB block', '$20'),
+        ('API Access', 'REST API with 10K calls/day', '$50'),
+        ('SSO Integration', 'SAML/OIDC support', '$25'),
+        ('Advanced Analytics', 'BI dashboards & reports', '$75'),
+        ('Data Export', 'Automated backups to S3/GCS', '$30'),
+    )
 
     addon_table = Table(addons, colWidths=[1.5*inch, 3*inch, 1.2*inch])
-    addon_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#48bb78')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('ALIGN', (1, 1), (1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-    ]))
+    addon_table.setStyle(_ADDON_TABLE_STYLE)
     story.append(addon_table)
     story.append(Spacer(1, 20))
 
@@ -224,217 +299,193 @@ def create_pricing_pdf(output_path: str):
         styles['Normal']
     ))
 
-    doc.build(story)
+    _draw_single_page(output_path, story)
     print(f"Created: {output_path}")
 
 
+def _cell(ws, value=None, font=None, fill=None, alignment=None, border=None, number_format=None):
+    """Build a styled cell for appending to a write-only worksheet."""
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if alignment is not None:
+        cell.alignment = alignment
+    if border is not None:
+        cell.border = border
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
+def _sum_formula(column, first_row, last_row):
+    """Build a SUM formula over one column's rows."""
+    return '=SUM(%s%d:%s%d)' % (column, first_row, column, last_row)
+
+
+def _set_column_widths(ws, count, width):
+    """Give the first count columns one width, written as a single <col> span."""
+    ws.column_dimensions['A'] = ColumnDimension(ws, min=1, max=count, width=width)
+
+
+def _make_header_cells(ws, headers, fill, alignment=None):
+    """Build a row of white-on-color bordered header cells."""
+    return [
+        _cell(ws, header, font=_HEADER_FONT, fill=fill, alignment=alignment, border=_BORDER)
+        for header in headers
+    ]
+
+
+def _write_body(ws, rows, col_formats, alignment=None):
+    """Append bordered data rows, with number formats keyed by 1-based column."""
+    for row in rows:
+        ws.append([
+            _cell(ws, value, alignment=alignment, border=_BORDER, number_format=col_formats.get(col))
+            for col, value in enumerate(row, 1)
+        ])
+
+
+def _save_workbook(wb, output_path):
+    """Serialize a workbook in memory and write it out in one go."""
+    buf = BytesIO()
+    wb.save(buf)
+    _write_file(output_path, buf)
+
+
+@_requires(HAS_OPENPYXL, "Excel", "openpyxl")
 def create_pricing_excel(output_path: str):
     """Create a sample pricing spreadsheet."""
-    if not HAS_OPENPYXL:
-        print("Skipping Excel creation - openpyxl not installed")
-        return
-
-    wb = Workbook()
+    # Write-only mode streams rows to disk instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
 
     # Sheet 1: Pricing Tiers
-    ws1 = wb.active
-    ws1.title = "Pricing Tiers"
+    ws1 = wb.create_sheet("Pricing Tiers")
 
-    # Header style
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="3182CE", end_color="3182CE", fill_type="solid")
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    # Column widths must be set before the first row is written
+    headers = ('Plan', 'Monthly Price', 'Annual Price', 'Max Users', 'Storage (GB)', 'API Calls/Day', 'Support Level')
+    _set_column_widths(ws1, len(headers), 15)
 
     # Headers
-    headers = ['Plan', 'Monthly Price', 'Annual Price', 'Max Users', 'Storage (GB)', 'API Calls/Day', 'Support Level']
-    for col, header in enumerate(headers, 1):
-        cell = ws1.cell(row=1, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.alignment = Alignment(horizontal='center')
-        cell.border = border
+    ws1.append(_make_header_cells(ws1, headers, _BLUE_FILL, alignment=_CENTER))
 
     # Data
-    data = [
-        ['Free', 0, 0, 1, 5, 100, 'Community'],
-        ['Starter', 29, 290, 5, 100, 1000, 'Email'],
-        ['Professional', 99, 990, 25, 1000, 10000, 'Priority'],
-        ['Business', 299, 2990, 100, 10000, 100000, '24/7 Phone'],
-        ['Enterprise', 999, 9990, 500, 100000, 1000000, 'Dedicated'],
-    ]
-
-    for row_num, row_data in enumerate(data, 2):
-        for col_num, value in enumerate(row_data, 1):
-            cell = ws1.cell(row=row_num, column=col_num, value=value)
-            cell.border = border
-            if col_num in [2, 3]:  # Price columns
-                cell.number_format = '$#,##0'
-            elif col_num in [5, 6]:  # Number columns
-                cell.number_format = '#,##0'
-            cell.alignment = Alignment(horizontal='center')
+    data = (
+        ('Free', 0, 0, 1, 5, 100, 'Community'),
+        ('Starter', 29, 290, 5, 100, 1000, 'Email'),
+        ('Professional', 99, 990, 25, 1000, 10000, 'Priority'),
+        ('Business', 299, 2990, 100, 10000, 100000, '24/7 Phone'),
+        ('Enterprise', 999, 9990, 500, 100000, 1000000, 'Dedicated'),
+    )
 
-    # Adjust column widths
-    for col in range(1, len(headers) + 1):
-        ws1.column_dimensions[get_column_letter(col)].width = 15
+    # Prices, then user/storage/API counts
+    _write_body(ws1, data, {2: '$#,##0', 3: '$#,##0', 5: '#,##0', 6: '#,##0'}, alignment=_CENTER)
 
     # Sheet 2: Revenue Calculator
     ws2 = wb.create_sheet("Revenue Calculator")
 
-    ws2['A1'] = 'Revenue Calculator'
-    ws2['A1'].font = Font(bold=True, size=14)
+    _set_column_widths(ws2, 5, 18)
 
-    calc_headers = ['Plan', 'Price', 'Customers', 'Monthly Revenue', 'Annual Revenue']
-    for col, header in enumerate(calc_headers, 1):
-        cell = ws2.cell(row=3, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = border
+    ws2.append([_cell(ws2, 'Revenue Calculator', font=_TITLE_FONT)])
+    ws2.append([])
 
-    plans = [
-        ['Free', 0, 1000],
-        ['Starter', 29, 500],
-        ['Professional', 99, 200],
-        ['Business', 299, 50],
-        ['Enterprise', 999, 10],
-    ]
+    calc_headers = ('Plan', 'Price', 'Customers', 'Monthly Revenue', 'Annual Revenue')
+    ws2.append(_make_header_cells(ws2, calc_headers, _BLUE_FILL))
 
-    for row_num, (plan, price, customers) in enumerate(plans, 4):
-        ws2.cell(row=row_num, column=1, value=plan).border = border
-        ws2.cell(row=row_num, column=2, value=price).border = border
-        ws2.cell(row=row_num, column=2).number_format = '$#,##0'
-        ws2.cell(row=row_num, column=3, value=customers).border = border
-
-        # Monthly Revenue formula
-        monthly_cell = ws2.cell(row=row_num, column=4)
-        monthly_cell.value = f'=B{row_num}*C{row_num}'
-        monthly_cell.number_format = '$#,##0'
-        monthly_cell.border = border
-
-        # Annual Revenue formula
-        annual_cell = ws2.cell(row=row_num, column=5)
-        annual_cell.value = f'=D{row_num}*12'
-        annual_cell.number_format = '$#,##0'
-        annual_cell.border = border
-
-    # Totals
-    total_row = 4 + len(plans)
-    ws2.cell(row=total_row, column=1, value='TOTAL').font = Font(bold=True)
-    ws2.cell(row=total_row, column=3, value=f'=SUM(C4:C{total_row-1})').font = Font(bold=True)
-    ws2.cell(row=total_row, column=4, value=f'=SUM(D4:D{total_row-1})').font = Font(bold=True)
-    ws2.cell(row=total_row, column=4).number_format = '$#,##0'
-    ws2.cell(row=total_row, column=5, value=f'=SUM(E4:E{total_row-1})').font = Font(bold=True)
-    ws2.cell(row=total_row, column=5).number_format = '$#,##0'
+    plans = (
+        ('Free', 0, 1000),
+        ('Starter', 29, 500),
+        ('Professional', 99, 200),
+        ('Business', 299, 50),
+        ('Enterprise', 999, 10),
+    )
 
-    for col in range(1, 6):
-        ws2.column_dimensions[get_column_letter(col)].width = 18
+    # Monthly and annual revenue are formulas over each plan's row
+    rows = [
+        (plan, price, customers, '=B%d*C%d' % (row_num, row_num), '=D%d*12' % row_num)
+        for row_num, (plan, price, customers) in enumerate(plans, 4)
+    ]
+    _write_body(ws2, rows, {2: '$#,##0', 4: '$#,##0', 5: '$#,##0'})
 
-    wb.save(output_path)
+    # Totals: a SUM over the plan rows in each column
+    total_row = 4 + len(plans)
+    ws2.append([
+        _cell(ws2, 'TOTAL', font=_BOLD),
+        None,
+        _cell(ws2, _sum_formula('C', 4, total_row - 1), font=_BOLD),
+        _cell(ws2, _sum_formula('D', 4, total_row - 1), font=_BOLD, number_format='$#,##0'),
+        _cell(ws2, _sum_formula('E', 4, total_row - 1), font=_BOLD, number_format='$#,##0'),
+    ])
+
+    _save_workbook(wb, output_path)
     print(f"Created: {output_path}")
 
 
+@_requires(HAS_OPENPYXL, "Excel", "openpyxl")
 def create_earnings_excel(output_path: str):
     """Create a sample earnings spreadsheet."""
-    if not HAS_OPENPYXL:
-        print("Skipping Excel creation - openpyxl not installed")
-        return
-
-    wb = Workbook()
+    # Write-only mode streams rows to disk instead of keeping every cell in memory
+    wb = Workbook(write_only=True)
 
     # Sheet 1: Quarterly Results
-    ws1 = wb.active
-    ws1.title = "Quarterly Results"
+    ws1 = wb.create_sheet("Quarterly Results")
 
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="1A365D", end_color="1A365D", fill_type="solid")
-    border = Border(
-        left=Side(style='thin'),
-        right=Side(style='thin'),
-        top=Side(style='thin'),
-        bottom=Side(style='thin')
-    )
+    _set_column_widths(ws1, 6, 18)
 
-    ws1['A1'] = 'TechCorp Inc. - Financial Summary 2024'
-    ws1['A1'].font = Font(bold=True, size=14)
-    ws1.merge_cells('A1:F1')
+    ws1.append([_cell(ws1, 'TechCorp Inc. - Financial Summary 2024', font=_TITLE_FONT)])
+    ws1.merged_cells.add('A1:F1')
+    ws1.append([])
 
-    headers = ['Metric', 'Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024 (Est)', 'FY 2024 (Est)']
-    for col, header in enumerate(headers, 1):
-        cell = ws1.cell(row=3, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = border
-        cell.alignment = Alignment(horizontal='center')
-
-    data = [
-        ['Revenue ($M)', 2100, 2250, 2400, 2550, '=SUM(B4:E4)'],
-        ['Cost of Revenue ($M)', 735, 765, 720, 790, '=SUM(B5:E5)'],
-        ['Gross Profit ($M)', '=B4-B5', '=C4-C5', '=D4-D5', '=E4-E5', '=SUM(B6:E6)'],
-        ['Operating Expenses ($M)', 980, 1020, 1200, 1100, '=SUM(B7:E7)'],
-        ['Operating Income ($M)', '=B6-B7', '=C6-C7', '=D6-D7', '=E6-E7', '=SUM(B8:E8)'],
-        ['Net Income ($M)', 280, 310, 340, 370, '=SUM(B9:E9)'],
-        ['EPS ($)', 1.52, 1.69, 1.85, 2.01, '=SUM(B10:E10)'],
-    ]
+    headers = ('Metric', 'Q1 2024', 'Q2 2024', 'Q3 2024', 'Q4 2024 (Est)', 'FY 2024 (Est)')
+    ws1.append(_make_header_cells(ws1, headers, _NAVY_FILL, alignment=_CENTER))
+
+    data = (
+        ('Revenue ($M)', 2100, 2250, 2400, 2550, '=SUM(B4:E4)'),
+        ('Cost of Revenue ($M)', 735, 765, 720, 790, '=SUM(B5:E5)'),
+        ('Gross Profit ($M)', '=B4-B5', '=C4-C5', '=D4-D5', '=E4-E5', '=SUM(B6:E6)'),
+        ('Operating Expenses ($M)', 980, 1020, 1200, 1100, '=SUM(B7:E7)'),
+        ('Operating Income ($M)', '=B6-B7', '=C6-C7', '=D6-D7', '=E6-E7', '=SUM(B8:E8)'),
+        ('Net Income ($M)', 280, 310, 340, 370, '=SUM(B9:E9)'),
+        ('EPS ($)', 1.52, 1.69, 1.85, 2.01, '=SUM(B10:E10)'),
+    )
 
     for row_num, row_data in enumerate(data, 4):
-        for col_num, value in enumerate(row_data, 1):
-            cell = ws1.cell(row=row_num, column=col_num, value=value)
-            cell.border = border
-            if col_num > 1:
-                if row_num == 10:  # EPS row
-                    cell.number_format = '$#,##0.00'
-                else:
-                    cell.number_format = '#,##0'
-                cell.alignment = Alignment(horizontal='right')
-
-    for col in range(1, 7):
-        ws1.column_dimensions[get_column_letter(col)].width = 18
+        row_cells = [_cell(ws1, row_data[0], border=_BORDER)]
+        # EPS row is in dollars and cents, everything else in whole millions
+        number_format = '$#,##0.00' if row_num == 10 else '#,##0'
+        for value in row_data[1:]:
+            row_cells.append(_cell(ws1, value, alignment=_RIGHT, border=_BORDER, number_format=number_format))
+        ws1.append(row_cells)
 
     # Sheet 2: Segment Breakdown
     ws2 = wb.create_sheet("Segment Breakdown")
 
-    ws2['A1'] = 'Revenue by Segment (Q3 2024)'
-    ws2['A1'].font = Font(bold=True, size=14)
+    _set_column_widths(ws2, 5, 18)
 
-    seg_headers = ['Segment', 'Revenue ($M)', '% of Total', 'YoY Growth', 'Margin %']
-    for col, header in enumerate(seg_headers, 1):
-        cell = ws2.cell(row=3, column=col, value=header)
-        cell.font = header_font
-        cell.fill = header_fill
-        cell.border = border
+    ws2.append([_cell(ws2, 'Revenue by Segment (Q3 2024)', font=_TITLE_FONT)])
+    ws2.append([])
 
-    segments = [
-        ['Cloud Services', 1200, 0.50, 0.25, 0.72],
-        ['Enterprise Software', 720, 0.30, 0.10, 0.68],
-        ['Hardware', 360, 0.15, 0.05, 0.45],
-        ['Professional Services', 120, 0.05, 0.08, 0.55],
-    ]
+    seg_headers = ('Segment', 'Revenue ($M)', '% of Total', 'YoY Growth', 'Margin %')
+    ws2.append(_make_header_cells(ws2, seg_headers, _NAVY_FILL))
+
+    segments = (
+        ('Cloud Services', 1200, 0.50, 0.25, 0.72),
+        ('Enterprise Software', 720, 0.30, 0.10, 0.68),
+        ('Hardware', 360, 0.15, 0.05, 0.45),
+        ('Professional Services', 120, 0.05, 0.08, 0.55),
+    )
 
-    for row_num, seg in enumerate(segments, 4):
-        for col_num, value in enumerate(seg, 1):
-            cell = ws2.cell(row=row_num, column=col_num, value=value)
-            cell.border = border
-            if col_num == 2:
-                cell.number_format = '#,##0'
-            elif col_num in [3, 4, 5]:
-                cell.number_format = '0%'
+    _write_body(ws2, segments, {2: '#,##0', 3: '0%', 4: '0%', 5: '0%'})
 
     # Total
     total_row = 4 + len(segments)
-    ws2.cell(row=total_row, column=1, value='TOTAL').font = Font(bold=True)
-    ws2.cell(row=total_row, column=2, value=f'=SUM(B4:B{total_row-1})').font = Font(bold=True)
-    ws2.cell(row=total_row, column=2).number_format = '#,##0'
-    ws2.cell(row=total_row, column=3, value=f'=SUM(C4:C{total_row-1})').font = Font(bold=True)
-    ws2.cell(row=total_row, column=3).number_format = '0%'
-
-    for col in range(1, 6):
-        ws2.column_dimensions[get_column_letter(col)].width = 18
+    ws2.append([
+        _cell(ws2, 'TOTAL', font=_BOLD),
+        _cell(ws2, _sum_formula('B', 4, total_row - 1), font=_BOLD, number_format='#,##0'),
+        _cell(ws2, _sum_formula('C', 4, total_row - 1), font=_BOLD, number_format='0%'),
+    ])
 
-    wb.save(output_path)
+    _save_workbook(wb, output_path)
     print(f"Created: {output_path}")
 
 